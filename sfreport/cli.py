@@ -1,23 +1,26 @@
 """CLI entry point for sfreport."""
 
+import contextlib
+import functools
+import itertools
 import os
+import sys
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from urllib.parse import urlparse
 
 import typer
-from dotenv import load_dotenv
 
-from sfreport.config import get_sf_binary
+from sfreport.config import get_sf_binary, resolve_sf_binary
 from sfreport.crawl import (
-    INLINK_STATUS_CODES,
+    InlinkScope,
+    InlinkStatus,
     export_from_crawl_file,
     export_inlinks,
+    export_inlinks_batch,
     run_crawl,
 )
-from sfreport.report import generate_report
-
-load_dotenv()
 
 app = typer.Typer(help="Screaming Frog crawl → Excel report generator.")
 
@@ -27,19 +30,58 @@ DB_EXPORTS_DIR = PROJECT_ROOT / "db-exports"
 EXPORTS_DIR = PROJECT_ROOT / "exports"
 
 
+@app.callback()
+def main(ctx: typer.Context) -> None:
+    """Screaming Frog crawl → Excel report generator."""
+    # Deferred so --help doesn't pay for reading .env
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    # Shared by the command that runs; see _sf_binary
+    ctx.obj = {}
+
+
+def _sf_binary(ctx: typer.Context, override: str | None) -> str:
+    """Resolve the SF binary once per invocation, exiting if it isn't found."""
+    try:
+        if override:
+            return resolve_sf_binary(override)
+        if "sf_binary" not in ctx.obj:
+            ctx.obj["sf_binary"] = get_sf_binary()
+        return ctx.obj["sf_binary"]
+    except FileNotFoundError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1) from None
+
+
+# Cached Paths are safe to share: Path is immutable and callers only mkdir them
+@functools.lru_cache(maxsize=128)
 def _exports_dir_for_url(url: str) -> Path:
     """Create an exports subdirectory named after the domain."""
     domain = urlparse(url).hostname or "unknown"
     return EXPORTS_DIR / domain
 
 
+@functools.lru_cache(maxsize=128)
 def _exports_dir_for_crawl_file(crawl_file: Path) -> Path:
     """Create an exports subdirectory named after the crawl file."""
     return EXPORTS_DIR / crawl_file.stem
 
 
+@contextlib.contextmanager
+def _resolve_export_dir(preferred: Path | None) -> Iterator[Path]:
+    """Yield preferred (created if needed), or a temp dir removed on exit."""
+    if preferred is not None:
+        preferred.mkdir(parents=True, exist_ok=True)
+        yield preferred
+    else:
+        with tempfile.TemporaryDirectory(prefix="sfreport_") as tmp:
+            yield Path(tmp)
+
+
 @app.command()
 def crawl(
+    ctx: typer.Context,
     url: str = typer.Argument(help="URL to crawl"),
     output: Path = typer.Option(
         "report.xlsx", "--output", "-o", help="Output Excel file path"
@@ -74,6 +116,10 @@ def crawl(
     ),
 ) -> None:
     """Run a fresh Screaming Frog crawl and generate an Excel report."""
+    from sfreport.report import generate_report
+
+    sf_binary = _sf_binary(ctx, sf_binary)
+
     # Resolve auth: CLI flags override .env values
     auth_user = user or os.getenv("BASIC_AUTH_USERNAME")
     auth_pass = password or os.getenv("BASIC_AUTH_PASSWORD")
@@ -92,17 +138,14 @@ def crawl(
             config = default_config
             typer.echo(f"Using config: {config}")
 
-    with tempfile.TemporaryDirectory(prefix="sfreport_") as tmp:
-        export_dir = Path(tmp)
-        if keep_exports:
-            export_dir = _exports_dir_for_url(url)
-            export_dir.mkdir(parents=True, exist_ok=True)
-
+    with _resolve_export_dir(
+        _exports_dir_for_url(url) if keep_exports else None
+    ) as export_dir:
         run_crawl(
             url,
             export_dir,
             config=config,
-            sf_binary=sf_binary or get_sf_binary(),
+            sf_binary=sf_binary,
             username=auth_user,
             password=auth_pass,
         )
@@ -119,6 +162,8 @@ def report(
     ),
 ) -> None:
     """Generate an Excel report from existing CSV exports."""
+    from sfreport.report import generate_report
+
     if not export_dir.is_dir():
         typer.echo(f"Error: {export_dir} is not a directory", err=True)
         raise typer.Exit(1)
@@ -128,6 +173,7 @@ def report(
 
 @app.command(name="sf")
 def sf(
+    ctx: typer.Context,
     args: list[str] = typer.Argument(
         None, help="Arguments to pass to Screaming Frog CLI"
     ),
@@ -138,33 +184,40 @@ def sf(
     ),
 ) -> None:
     """Run the Screaming Frog SEO Spider CLI directly."""
-    import subprocess
-
-    cmd = [sf_binary or get_sf_binary()] + (args or [])
+    cmd = [_sf_binary(ctx, sf_binary)] + (args or [])
     typer.echo(f"Running: {' '.join(cmd)}")
-    raise typer.Exit(subprocess.run(cmd).returncode)
+    # Replace this process with SF so Python doesn't sit in memory during a crawl;
+    # SF's exit code becomes ours
+    sys.stdout.flush()
+    os.execvp(cmd[0], cmd)
 
 
 @app.command()
 def inlinks(
+    ctx: typer.Context,
     crawl_file: Path = typer.Argument(
         help="Path to a .seospider or .dbseospider crawl file",
     ),
-    status: str = typer.Option(
-        "all",
+    status: list[InlinkStatus] = typer.Option(
+        [InlinkStatus.ALL],
         "--status",
         "-s",
-        help=f"Filter by status code: {', '.join(INLINK_STATUS_CODES)}",
+        help="Filter by status code (repeatable)",
+    ),
+    scope: list[InlinkScope] = typer.Option(
+        None,
+        "--scope",
+        help="Link scope (repeatable, default: both)",
     ),
     internal: bool = typer.Option(
         False,
         "--internal",
-        help="Only internal inlinks",
+        help="Only internal inlinks (same as --scope internal)",
     ),
     external: bool = typer.Option(
         False,
         "--external",
-        help="Only external inlinks",
+        help="Only external inlinks (same as --scope external)",
     ),
     output_dir: Path = typer.Option(
         None,
@@ -172,6 +225,11 @@ def inlinks(
         "-o",
         help="Output directory for CSVs (default: exports/<crawl-name>/)",
     ),
+    parallel: bool = typer.Option(
+        False,
+        "--parallel",
+        help="Run one SF process per status/scope in parallel, each in its own subfolder",
+    ),
     sf_binary: str = typer.Option(
         None,
         "--sf-binary",
@@ -179,39 +237,46 @@ def inlinks(
     ),
 ) -> None:
     """Export inlinks from a saved crawl, optionally filtered by response status."""
-    if internal and external:
-        typer.echo("Error: --internal and --external are mutually exclusive", err=True)
-        raise typer.Exit(1)
-
-    if status not in INLINK_STATUS_CODES:
-        typer.echo(
-            f"Error: unknown status {status!r}. Choose from: {', '.join(INLINK_STATUS_CODES)}",
-            err=True,
-        )
-        raise typer.Exit(1)
+    scopes = list(scope or [])
+    if internal:
+        scopes.append(InlinkScope.INTERNAL)
+    if external:
+        scopes.append(InlinkScope.EXTERNAL)
 
     if not crawl_file.exists():
         typer.echo(f"Error: {crawl_file} not found", err=True)
         raise typer.Exit(1)
 
-    scope = "internal" if internal else "external" if external else "both"
+    sf_binary = _sf_binary(ctx, sf_binary)
 
     if output_dir is None:
         output_dir = _exports_dir_for_crawl_file(crawl_file)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    export_inlinks(
-        crawl_file,
-        output_dir,
-        status=status,
-        scope=scope,
-        sf_binary=sf_binary or get_sf_binary(),
-    )
+    statuses = dict.fromkeys(status)
+    scopes = dict.fromkeys(scopes or [InlinkScope.BOTH])
+    if parallel:
+        export_inlinks_batch(
+            crawl_file,
+            output_dir,
+            itertools.product(statuses, scopes),
+            sf_binary=sf_binary,
+        )
+    else:
+        # All combinations go to SF in one run, so the crawl is loaded once
+        export_inlinks(
+            crawl_file,
+            output_dir,
+            statuses=statuses,
+            scopes=scopes,
+            sf_binary=sf_binary,
+        )
     typer.echo(f"Inlinks exported to {output_dir}")
 
 
 @app.command(name="from-db")
 def from_db(
+    ctx: typer.Context,
     crawl_file: Path = typer.Argument(
         help="Path to a .seospider or .dbseospider crawl file",
     ),
@@ -228,19 +293,28 @@ def from_db(
         "--keep-exports",
         help="Keep intermediate CSV exports (saved to exports/<crawl-name>/)",
     ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Re-export even if kept exports of this crawl file are up to date",
+    ),
 ) -> None:
     """Re-export from a saved crawl database and generate an Excel report."""
+    from sfreport.report import generate_report
+
     if not crawl_file.exists():
         typer.echo(f"Error: {crawl_file} not found", err=True)
         raise typer.Exit(1)
 
-    with tempfile.TemporaryDirectory(prefix="sfreport_") as tmp:
-        export_dir = Path(tmp)
-        if keep_exports:
-            export_dir = _exports_dir_for_crawl_file(crawl_file)
-            export_dir.mkdir(parents=True, exist_ok=True)
+    sf_binary = _sf_binary(ctx, sf_binary)
 
+    with _resolve_export_dir(
+        _exports_dir_for_crawl_file(crawl_file) if keep_exports else None
+    ) as export_dir:
         export_from_crawl_file(
-            crawl_file, export_dir, sf_binary=sf_binary or get_sf_binary()
+            crawl_file,
+            export_dir,
+            sf_binary=sf_binary,
+            force=force,
         )
         generate_report(export_dir, output)
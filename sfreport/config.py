@@ -1,5 +1,8 @@
 """Load sfreport configuration from TOML files."""
 
+import copy
+import functools
+import shutil
 import tomllib
 from pathlib import Path
 
@@ -10,22 +13,54 @@ _CONFIG_PATHS = [
 ]
 
 
-def load_config() -> dict:
-    """Load and merge config from ~/.sfreport.toml and ./.sfreport.toml.
+def _config_key() -> tuple[tuple[Path, int | None], ...]:
+    """Identify the current config state by each file's path and mtime."""
+    key = []
+    for path in _CONFIG_PATHS:
+        path = path.absolute()
+        mtime = path.stat().st_mtime_ns if path.is_file() else None
+        key.append((path, mtime))
+    return tuple(key)
 
-    Project-level values override user-level values.
-    """
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(key: tuple[tuple[Path, int | None], ...]) -> dict:
     merged: dict = {}
-    for path in _CONFIG_PATHS:
-        if path.is_file():
+    for path, mtime in key:
+        if mtime is not None:
             with open(path, "rb") as f:
                 merged |= tomllib.load(f)
     return merged
 
 
+def load_config() -> dict:
+    """Load and merge config from ~/.sfreport.toml and ./.sfreport.toml.
+
+    Project-level values override user-level values. Parsed results are
+    cached until either file's mtime changes.
+    """
+    # Deep copy so callers can't mutate nested tables held by the cache
+    return copy.deepcopy(_load_config_cached(_config_key()))
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_sf_binary(binary: str) -> str:
+    """Resolve an SF binary name or path to a verified absolute path."""
+    path = shutil.which(binary)
+    if path is None:
+        raise FileNotFoundError(
+            f"Screaming Frog binary not found or not executable: {binary}\n"
+            "Pass --sf-binary or set [screaming_frog] binary in .sfreport.toml."
+        )
+    return str(Path(path).absolute())
+
+
 def get_sf_binary() -> str:
-    """Return the configured SF binary path, or the platform default."""
+    """Return the configured SF binary path, or the platform default.
+
+    Raises FileNotFoundError if it doesn't point at an executable.
+    """
     from sfreport.crawl import SF_BINARY
 
     cfg = load_config()
-    return cfg.get("screaming_frog", {}).get("binary", SF_BINARY)
+    return resolve_sf_binary(cfg.get("screaming_frog", {}).get("binary", SF_BINARY))
@@ -1,8 +1,17 @@
 """Run Screaming Frog SEO Spider in headless mode and export crawl data."""
 
+import hashlib
+import itertools
+import os
+import shlex
 import subprocess
 import sys
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from enum import StrEnum
 from pathlib import Path
+from typing import TextIO
 from urllib.parse import quote, urlparse, urlunparse
 
 SF_BINARY = (
@@ -16,9 +25,31 @@ EXPORTS = {
     "tabs": "Internal:All",
 }
 
+# Written next to re-exported CSVs to detect an unchanged crawl file
+_CACHE_KEY_FILE = ".sfreport_cache_key"
+
+
+class InlinkStatus(StrEnum):
+    """Response status filter for inlink exports."""
+
+    ALL = "all"
+    S2XX = "2xx"
+    S3XX = "3xx"
+    S4XX = "4xx"
+    S5XX = "5xx"
+
+
+class InlinkScope(StrEnum):
+    """Internal/external filter for inlink exports."""
+
+    BOTH = "both"
+    INTERNAL = "internal"
+    EXTERNAL = "external"
+
+
 # SF bulk-export strings for inlinks, keyed by (status, scope)
-INLINK_STATUS_CODES = ("all", "2xx", "3xx", "4xx", "5xx")
-INLINK_SCOPES = ("both", "internal", "external")
+INLINK_STATUS_CODES = tuple(s.value for s in InlinkStatus)
+INLINK_SCOPES = tuple(s.value for s in InlinkScope)
 
 _STATUS_LABELS = {
     "2xx": "Success (2xx)",
@@ -57,43 +88,100 @@ def _inlink_tab_export(status: str, scope: str) -> str | None:
     return f"Response Codes:{prefix} {label}"
 
 
+# (bulk export, tab export) for every valid (status, scope)
+_INLINK_TABLE: dict[tuple[str, str], tuple[str, str | None]] = {
+    (status, scope): (
+        _inlink_bulk_export(status, scope),
+        _inlink_tab_export(status, scope),
+    )
+    for status, scope in itertools.product(INLINK_STATUS_CODES, INLINK_SCOPES)
+}
+
+
 def _embed_credentials(url: str, username: str, password: str) -> str:
     """Embed basic auth credentials into a URL."""
-    parsed = urlparse(url)
-    netloc = f"{quote(username, safe='')}:{quote(password, safe='')}@{parsed.hostname}"
-    if parsed.port:
-        netloc += f":{parsed.port}"
-    return urlunparse(parsed._replace(netloc=netloc))
+    userinfo = f"{quote(username, safe='')}:{quote(password, safe='')}"
+    scheme_end = url.find("://")
+    if scheme_end == -1:
+        # Not scheme://host form; let urlparse make sense of it
+        parsed = urlparse(url)
+        netloc = f"{userinfo}@{parsed.hostname}"
+        if parsed.port:
+            netloc += f":{parsed.port}"
+        return urlunparse(parsed._replace(netloc=netloc))
+
+    # Only the netloc changes, so splice around it instead of reparsing
+    host_start = scheme_end + 3
+    host_end = len(url)
+    for sep in "/?#":
+        idx = url.find(sep, host_start)
+        if idx != -1 and idx < host_end:
+            host_end = idx
+    # Drop any credentials already present in the URL
+    host = url[host_start:host_end].rpartition("@")[2]
+    return f"{url[:host_start]}{userinfo}@{host}{url[host_end:]}"
+
+
+# Everything after --output-folder <dir> is the same on every run
+_EXPORT_FLAGS_TAIL = (
+    "--overwrite",
+    "--save-report",
+    EXPORTS["reports"],
+    "--bulk-export",
+    EXPORTS["bulk"],
+    "--export-tabs",
+    EXPORTS["tabs"],
+)
 
 
 def _build_export_flags(output_dir: Path) -> list[str]:
     """Common export flags shared between crawl and re-export."""
-    return [
-        "--headless",
-        "--output-folder",
-        str(output_dir),
-        "--overwrite",
-        "--save-report",
-        EXPORTS["reports"],
-        "--bulk-export",
-        EXPORTS["bulk"],
-        "--export-tabs",
-        EXPORTS["tabs"],
-    ]
+    return ["--headless", "--output-folder", os.fspath(output_dir), *_EXPORT_FLAGS_TAIL]
 
 
-def _run_sf(cmd: list[str], label: str) -> None:
-    """Execute SF CLI and handle errors."""
-    print(f"{label}")
-    print(f"Command: {' '.join(cmd)}\n")
+def _forward(src: TextIO, dest: TextIO) -> None:
+    """Copy a subprocess pipe to one of our streams line by line."""
+    with src:
+        for line in src:
+            dest.write(line)
+            dest.flush()
 
-    result = subprocess.run(cmd, capture_output=True, text=True)
 
-    if result.returncode != 0:
-        print(f"SF stderr:\n{result.stderr}", file=sys.stderr)
-        raise RuntimeError(f"Screaming Frog exited with code {result.returncode}")
+def _run_sf(cmd: list[str], label: str, verbose: bool = True) -> None:
+    """Execute SF CLI, streaming its output, and handle errors.
 
-    print("Screaming Frog finished.\n")
+    Pass verbose=False to skip echoing the label, command line and the
+    finished message; SF's own output is still streamed.
+    """
+    if verbose:
+        # shlex.join quotes paths with spaces, e.g. the default macOS SF_BINARY
+        sys.stdout.write(f"{label}\nCommand: {shlex.join(cmd)}\n\n")
+
+    # Replace undecodable bytes so a stray one can't kill a pump mid-crawl
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+        bufsize=1,
+    )
+    # Drain both pipes concurrently so neither can fill up and block SF
+    pumps = [
+        threading.Thread(target=_forward, args=(proc.stdout, sys.stdout), daemon=True),
+        threading.Thread(target=_forward, args=(proc.stderr, sys.stderr), daemon=True),
+    ]
+    for pump in pumps:
+        pump.start()
+    returncode = proc.wait()
+    for pump in pumps:
+        pump.join()
+
+    if returncode != 0:
+        raise RuntimeError(f"Screaming Frog exited with code {returncode}")
+
+    if verbose:
+        sys.stdout.write("Screaming Frog finished.\n\n")
 
 
 def run_crawl(
@@ -118,69 +206,162 @@ def run_crawl(
     cmd += _build_export_flags(output_dir)
 
     if config:
-        cmd.extend(["--config", str(config)])
+        cmd.extend(["--config", os.fspath(config)])
 
     _run_sf(cmd, f"Starting crawl of {url} → {output_dir}")
     return output_dir
 
 
+def _inlink_exports(status: str, scope: str) -> tuple[str, str | None]:
+    """Look up the (bulk, tab) export strings, validating status and scope."""
+    exports = _INLINK_TABLE.get((status, scope))
+    if exports is None:
+        if status not in INLINK_STATUS_CODES:
+            raise ValueError(
+                f"Unknown status {status!r}, expected: {', '.join(INLINK_STATUS_CODES)}"
+            )
+        raise ValueError(
+            f"Unknown scope {scope!r}, expected: {', '.join(INLINK_SCOPES)}"
+        )
+    return exports
+
+
 def export_inlinks(
     crawl_file: Path,
     output_dir: Path,
-    status: str = "all",
-    scope: str = "both",
+    statuses: Iterable[str] = ("all",),
+    scopes: Iterable[str] = ("both",),
     sf_binary: str = SF_BINARY,
+    verbose: bool = True,
 ) -> Path:
     """Export inlinks from a saved crawl, optionally filtered by status and scope.
 
+    Every status/scope combination is exported in a single SF run, so the
+    crawl is only loaded once. verbose is passed on to _run_sf.
+
     Returns the output directory containing exported CSVs.
     """
-    if status not in INLINK_STATUS_CODES:
-        raise ValueError(
-            f"Unknown status {status!r}, expected: {', '.join(INLINK_STATUS_CODES)}"
-        )
-    if scope not in INLINK_SCOPES:
-        raise ValueError(
-            f"Unknown scope {scope!r}, expected: {', '.join(INLINK_SCOPES)}"
-        )
+    combos = list(itertools.product(statuses, scopes))
+    if not combos:
+        raise ValueError("At least one status and one scope are required")
+
+    # dict keys keep order while dropping repeats ("all" ignores scope)
+    bulk: dict[str, None] = {}
+    tabs: dict[str, None] = {}
+    for status, scope in combos:
+        bulk_export, tab_export = _inlink_exports(status, scope)
+        bulk[bulk_export] = None
+        if tab_export:
+            tabs[tab_export] = None
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    bulk = _inlink_bulk_export(status, scope)
-    tabs = _inlink_tab_export(status, scope)
-
     cmd = [
         sf_binary,
         "--headless",
         "--load-crawl",
-        str(crawl_file),
+        os.fspath(crawl_file),
         "--output-folder",
-        str(output_dir),
+        os.fspath(output_dir),
         "--overwrite",
         "--bulk-export",
-        bulk,
+        ",".join(bulk),
     ]
     if tabs:
-        cmd.extend(["--export-tabs", tabs])
-
-    label = f"{scope} {status}" if status != "all" else "all"
-    _run_sf(cmd, f"Exporting {label} inlinks from {crawl_file.name} → {output_dir}")
+        cmd.extend(["--export-tabs", ",".join(tabs)])
+
+    labels = dict.fromkeys(
+        f"{scope} {status}" if status != "all" else "all" for status, scope in combos
+    )
+    _run_sf(
+        cmd,
+        f"Exporting {', '.join(labels)} inlinks from {crawl_file.name} → {output_dir}",
+        verbose=verbose,
+    )
     return output_dir
 
 
+def export_inlinks_batch(
+    crawl_file: Path,
+    output_root: Path,
+    combos: Iterable[tuple[str, str]],
+    sf_binary: str = SF_BINARY,
+    max_workers: int | None = None,
+) -> Path:
+    """Export each (status, scope) combo with its own SF process, in parallel.
+
+    Fallback for when a single combined export_inlinks run isn't an option.
+    Each combo is written to output_root/<status>_<scope>/; combos needing the
+    same export (e.g. "all" with any scope) only run once, for the first.
+
+    Returns output_root.
+    """
+    # Fail on a bad combo before launching anything, and keep only the first
+    # combo per distinct export ("all" ignores scope) so no SF run repeats one
+    by_exports: dict[tuple[str, str | None], tuple[str, str]] = {}
+    for status, scope in combos:
+        by_exports.setdefault(_inlink_exports(status, scope), (status, scope))
+    combos = list(by_exports.values())
+    if not combos:
+        raise ValueError("At least one status/scope combination is required")
+
+    workers = max_workers or min(len(combos), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                export_inlinks,
+                crawl_file,
+                output_root / f"{status}_{scope}",
+                statuses=(status,),
+                scopes=(scope,),
+                sf_binary=sf_binary,
+                # Concurrent runs would interleave headers; progress is
+                # reported below instead
+                verbose=False,
+            ): (status, scope)
+            for status, scope in combos
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            status, scope = futures[future]
+            out = future.result()
+            print(f"[{done}/{len(futures)}] {scope} {status} inlinks → {out}")
+    return output_root
+
+
+def _export_cache_key(crawl_file: Path) -> str:
+    """Fingerprint a crawl file and the export set for skipping re-exports."""
+    stat = crawl_file.stat()
+    key = f"{crawl_file.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:{EXPORTS}"
+    return hashlib.blake2b(key.encode()).hexdigest()
+
+
 def export_from_crawl_file(
     crawl_file: Path,
     output_dir: Path,
     sf_binary: str = SF_BINARY,
+    force: bool = False,
 ) -> Path:
     """Load a saved .seospider/.dbseospider crawl and re-export data.
 
+    Skips SF entirely if output_dir already holds exports of the same,
+    unchanged crawl file, unless force is set.
+
     Returns the output directory containing exported CSVs.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    cmd = [sf_binary, "--load-crawl", str(crawl_file)]
+    key = _export_cache_key(crawl_file)
+    key_path = output_dir / _CACHE_KEY_FILE
+    if not force and key_path.is_file() and key_path.read_text() == key:
+        print(f"Exports in {output_dir} are up to date, skipping Screaming Frog.\n")
+        return output_dir
+
+    cmd = [sf_binary, "--load-crawl", os.fspath(crawl_file)]
     cmd += _build_export_flags(output_dir)
 
+    # SF overwrites CSVs as it goes, so a failed run must not leave the old
+    # key matching half-written exports
+    key_path.unlink(missing_ok=True)
     _run_sf(cmd, f"Exporting from {crawl_file.name} → {output_dir}")
+    key_path.write_text(key)
     return output_dir
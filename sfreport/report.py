@@ -1,12 +1,20 @@
 """Parse Screaming Frog CSV exports and generate an Excel report."""
 
+import fnmatch
+import functools
+import hashlib
+import operator
+import os
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
 import pandas as pd
 from openpyxl import Workbook
+from openpyxl.cell import Cell, WriteOnlyCell
 from openpyxl.styles import Alignment, Font, PatternFill
 from openpyxl.utils import get_column_letter
 
@@ -16,6 +24,7 @@ ACCESSIBILITY_URL_COLUMNS = ("Address", "URL")
 
 # Styling
 HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+BOLD_FONT = Font(bold=True)
 HEADER_FILL = PatternFill(start_color="2F5496", end_color="2F5496", fill_type="solid")
 LINK_FONT = Font(color="0563C1", underline="single")
 WRAP_ALIGNMENT = Alignment(wrap_text=True, vertical="top")
@@ -35,20 +44,54 @@ PAGE_COLUMNS = [
     "Help URL",
 ]
 
+# Pulls a row dict's values in PAGE_COLUMNS order. Every row producer fills
+# all of these keys with strings
+_PAGE_VALUES = operator.itemgetter(*PAGE_COLUMNS)
+
+# Issues Overview columns kept as metadata, keyed by our name for them
+_OVERVIEW_COLUMNS = {
+    "Priority": "Issue Priority",
+    "Description": "Description",
+    "How To Fix": "How To Fix",
+    "Help URL": "Help URL",
+    "Issue Type": "Issue Type",
+}
+
+# Accessibility violation columns, keyed by the PAGE_COLUMNS they fill
+_A11Y_COLUMNS = {
+    "Issue": "Issue",
+    "Priority": "Priority",
+    "Details": "Location on Page",
+    "Description": "Issue Description",
+    "How To Fix": "How To Fix",
+    "Help URL": "Help URL",
+}
+
+# Parse issues CSVs in worker processes only once their combined size
+# reaches this many bytes and at least _MIN_PARSE_WORKERS cores are free.
+# Each spawned worker pays ~0.5s importing pandas, and unpickling the rows
+# on the main process costs about a third of parsing them, so smaller
+# inputs or fewer cores come out slower than parsing serially
+_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+_MIN_PARSE_WORKERS = 4
+_MAX_PARSE_WORKERS = 8
+
+# Issues CSV columns left out of a page's Details
+_ISSUE_NOISE_COLUMNS = frozenset({"Indexability", "Indexability Status"})
+
 
 # ---------------------------------------------------------------------------
 # URL helpers
 # ---------------------------------------------------------------------------
 
-_URL_RE = re.compile(r"^https?://", re.IGNORECASE)
-
 
 def _normalize_url(url: str) -> str:
     return url.replace("http://", "https://", 1) if url.startswith("http://") else url
 
 
 def _is_url(value: str) -> bool:
-    return bool(_URL_RE.match(value))
+    # Case-insensitive "^https?://" without going through the regex engine
+    return value[:8].lower().startswith(("http://", "https://"))
 
 
 def _clean(value) -> str:
@@ -59,14 +102,36 @@ def _clean(value) -> str:
     return "" if s.lower() == "nan" else s
 
 
+@functools.lru_cache(maxsize=8192, typed=True)
+def _clean_cached(value) -> str:
+    """_clean for CSV cells, whose descriptions and help URLs repeat a lot.
+
+    Repeated values also come back as one shared string object.
+    """
+    return _clean(value)
+
+
 # ---------------------------------------------------------------------------
 # CSV loaders
 # ---------------------------------------------------------------------------
 
 
 def _find_csv(export_dir: Path, pattern: str) -> Path | None:
-    matches = sorted(export_dir.glob(pattern))
-    return matches[0] if matches else None
+    # One directory scan for the first match by name; patterns stay
+    # case-sensitive, as with glob
+    try:
+        with os.scandir(export_dir) as entries:
+            name = min(
+                (
+                    e.name
+                    for e in entries
+                    if fnmatch.fnmatchcase(e.name, pattern) and e.is_file()
+                ),
+                default=None,
+            )
+    except FileNotFoundError:
+        return None
+    return export_dir / name if name else None
 
 
 def _load_issues_overview(export_dir: Path) -> pd.DataFrame | None:
@@ -104,107 +169,195 @@ def _load_accessibility_summary(export_dir: Path) -> pd.DataFrame | None:
     return pd.read_csv(csv_path, encoding="utf-8-sig")
 
 
-_ASSET_EXT_RE = re.compile(
-    r"\.(?:jpg|jpeg|png|gif|svg|webp|ico|bmp|tiff"
-    r"|pdf|doc|docx|xls|xlsx|ppt|pptx"
-    r"|css|js|json|xml|txt|csv"
-    r"|woff|woff2|ttf|eot|otf"
-    r"|mp4|mp3|wav|avi|mov|webm"
-    r"|zip|gz|tar|rar)(?:\?.*)?$",
-    re.IGNORECASE,
+_ASSET_EXTENSIONS = tuple(
+    f".{ext}"
+    for ext in (
+        "jpg jpeg png gif svg webp ico bmp tiff"
+        " pdf doc docx xls xlsx ppt pptx"
+        " css js json xml txt csv"
+        " woff woff2 ttf eot otf"
+        " mp4 mp3 wav avi mov webm"
+        " zip gz tar rar"
+    ).split()
 )
 
 
-def _load_internal_urls(export_dir: Path) -> set[str]:
+def _is_asset_url(url: str) -> bool:
+    """True if the URL ends in an asset extension, optionally before a ?query."""
+    url = url.lower()
+    if url.endswith(_ASSET_EXTENSIONS):
+        return True
+    # str.endswith with an end index checks before each "?" without slicing
+    q = url.find("?")
+    while q != -1:
+        if url.endswith(_ASSET_EXTENSIONS, 0, q):
+            return True
+        q = url.find("?", q + 1)
+    return False
+
+
+def _load_internal_urls(export_dir: Path) -> frozenset[str]:
     """Load the set of internal HTML page URLs from the Internal:All export."""
     csv_path = _find_csv(export_dir, "*internal_all*.csv")
     if csv_path is None:
         csv_path = _find_csv(export_dir, "*nternal*ll*.csv")
     if csv_path is None:
-        return set()
+        return frozenset()
     df = pd.read_csv(
-        csv_path, encoding="utf-8-sig", usecols=["Address", "Content Type"]
+        csv_path,
+        encoding="utf-8-sig",
+        usecols=["Address", "Content Type"],
+        dtype=str,
     )
     # Only include HTML pages (not images, PDFs, CSS, JS, etc.)
     html_mask = df["Content Type"].str.contains("html", na=False)
     # Exclude asset file extensions even if SF reports them as text/html (soft 404s)
-    not_asset = ~df["Address"].str.contains(_ASSET_EXT_RE, na=False)
-    return {
-        _normalize_url(u) for u in df.loc[html_mask & not_asset, "Address"].dropna()
-    }
+    not_asset = ~df["Address"].map(_is_asset_url, na_action="ignore").eq(True)
+    # map() over the raw array beats both a Series comprehension and .str here
+    urls = df.loc[html_mask & not_asset, "Address"].dropna().to_numpy()
+    return frozenset(map(_normalize_url, urls))
 
 
 def _load_per_page_issues(
     export_dir: Path,
     issues_overview: pd.DataFrame | None,
-    internal_urls: set[str],
-) -> dict[str, list[dict]]:
+    internal_urls: frozenset[str],
+) -> Iterator[tuple[str, dict]]:
     """Load per-page issues from issues_reports/ folder.
 
     Only includes URLs in the internal_urls set.
-    Returns {url: [row_dict, ...]} where each row_dict has PAGE_COLUMNS keys.
+    Yields (url, row_dict) pairs where each row_dict has PAGE_COLUMNS keys.
     """
     issues_dir = export_dir / "issues_reports"
     if not issues_dir.is_dir():
-        return {}
+        return
 
     # Build lookup from Issues Overview for metadata
     overview_lookup: dict[str, dict] = {}
     if issues_overview is not None:
-        for _, row in issues_overview.iterrows():
-            name = str(row.get("Issue Name", ""))
-            overview_lookup[name.lower()] = {
-                "Priority": _clean(row.get("Issue Priority", "")),
-                "Description": _clean(row.get("Description", "")),
-                "How To Fix": _clean(row.get("How To Fix", "")),
-                "Help URL": _clean(row.get("Help URL", "")),
-                "Issue Type": _clean(row.get("Issue Type", "")),
+        # Missing columns come back as NaN, which _clean_cached turns into ""
+        fields = issues_overview.reindex(
+            columns=["Issue Name", *_OVERVIEW_COLUMNS.values()]
+        )
+        for name, *values in fields.itertuples(index=False, name=None):
+            overview_lookup[str(name).lower()] = {
+                key: _clean_cached(v) for key, v in zip(_OVERVIEW_COLUMNS, values)
             }
 
-    url_issues: dict[str, list[dict]] = defaultdict(list)
+    # Index overview names by word once rather than scanning them all per
+    # issues CSV. Accessibility issues are skipped — those come from the
+    # violations CSV
+    overview_entries = [
+        (key, meta)
+        for key, meta in overview_lookup.items()
+        if not key.startswith("accessibility:")
+    ]
+    overview_words: dict[str, list[int]] = defaultdict(list)
+    for i, (key, _) in enumerate(overview_entries):
+        for word in set(key.split()):
+            overview_words[word].append(i)
+
+    # Skip inlinks CSVs — they're about links pointing TO the issue, not the page
+    csv_paths = [
+        p for p in sorted(issues_dir.glob("*.csv")) if "inlinks" not in p.stem.lower()
+    ]
+
+    # Files are independent, so parse them in worker processes when there's
+    # enough data to outweigh the pool's start-up cost
+    context = (overview_lookup, overview_entries, dict(overview_words), internal_urls)
+    workers = min(len(csv_paths), os.cpu_count() or 1, _MAX_PARSE_WORKERS)
+    total_bytes = sum(p.stat().st_size for p in csv_paths)
+    if workers >= _MIN_PARSE_WORKERS and total_bytes >= _PARALLEL_MIN_BYTES:
+        # The shared lookups are sent to each worker once, not with every task
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_issue_worker,
+            initargs=context,
+        ) as pool:
+            for rows in pool.map(_parse_issue_csv_in_worker, csv_paths):
+                yield from rows
+    else:
+        for csv_path in csv_paths:
+            yield from _parse_issue_csv(csv_path, *context)
+
+
+# Set in each issues CSV worker process by _init_issue_worker
+_worker_context: tuple = ()
+
 
-    for csv_path in sorted(issues_dir.glob("*.csv")):
-        # Derive issue name from filename
-        issue_name = csv_path.stem.replace("_", " ").title()
+def _init_issue_worker(*context) -> None:
+    global _worker_context
+    _worker_context = context
 
-        # Skip inlinks CSVs — they're about links pointing TO the issue, not the page
-        if "inlinks" in csv_path.stem.lower():
+
+def _parse_issue_csv_in_worker(csv_path: Path) -> list[tuple[str, dict]]:
+    return _parse_issue_csv(csv_path, *_worker_context)
+
+
+def _parse_issue_csv(
+    csv_path: Path,
+    overview_lookup: dict[str, dict],
+    overview_entries: list[tuple[str, dict]],
+    overview_words: dict[str, list[int]],
+    internal_urls: frozenset[str],
+) -> list[tuple[str, dict]]:
+    """Parse one issues_reports/ CSV into (url, row_dict) pairs.
+
+    May run in worker processes, so every argument must be picklable.
+    """
+    # Derive issue name from filename
+    issue_name = csv_path.stem.replace("_", " ").title()
+
+    try:
+        # Details are shown as text, so skip type inference and noise columns
+        df = pd.read_csv(
+            csv_path,
+            encoding="utf-8-sig",
+            dtype=str,
+            usecols=lambda c: c not in _ISSUE_NOISE_COLUMNS,
+        )
+    except Exception:
+        return []
+
+    # Find the URL/Address column
+    addr_col = next(
+        (c for c in df.columns if c in ("Address", "URL")),
+        None,
+    )
+    if addr_col is None:
+        return []
+
+    # Try to match to Issues Overview for richer metadata
+    meta = _match_overview(
+        issue_name, overview_lookup, overview_entries, overview_words
+    )
+
+    # Collect any extra detail columns (everything but the address).
+    # Find each column's non-blank cells once, up front
+    details_by_col = []
+    for col in df.columns:
+        if col == addr_col:
             continue
+        strs = df[col].astype(str)
+        keep = df[col].notna() & strs.str.strip().ne("")
+        details_by_col.append(
+            ((col + ": " + strs).to_numpy(), keep.to_numpy(dtype=bool))
+        )
 
-        try:
-            df = pd.read_csv(csv_path, encoding="utf-8-sig")
-        except Exception:
+    rows = []
+    for i, addr in enumerate(df[addr_col].to_numpy()):
+        url = _normalize_url(str(addr))
+        # Only include internal URLs
+        if internal_urls and url not in internal_urls:
             continue
 
-        # Find the URL/Address column
-        addr_col = next(
-            (c for c in df.columns if c in ("Address", "URL")),
-            None,
+        detail_str = "; ".join(
+            details[i] for details, keep in details_by_col if keep[i]
         )
-        if addr_col is None:
-            continue
 
-        # Try to match to Issues Overview for richer metadata
-        meta = _match_overview(issue_name, overview_lookup)
-
-        for _, row in df.iterrows():
-            url = _normalize_url(str(row[addr_col]))
-            # Only include internal URLs
-            if internal_urls and url not in internal_urls:
-                continue
-
-            # Collect any extra detail columns (skip Address and common noise)
-            skip = {addr_col, "Indexability", "Indexability Status"}
-            details = []
-            for col in df.columns:
-                if col in skip:
-                    continue
-                val = row[col]
-                if pd.notna(val) and str(val).strip():
-                    details.append(f"{col}: {val}")
-            detail_str = "; ".join(details) if details else ""
-
-            url_issues[url].append(
+        rows.append(
+            (
+                url,
                 {
                     "Type": "Issue",
                     "Issue": meta.get("name", issue_name),
@@ -213,34 +366,42 @@ def _load_per_page_issues(
                     "Description": meta.get("Description", ""),
                     "How To Fix": meta.get("How To Fix", ""),
                     "Help URL": meta.get("Help URL", ""),
-                }
+                },
             )
+        )
+    return rows
 
-    return dict(url_issues)
 
+def _match_overview(
+    filename_issue: str,
+    overview: dict[str, dict],
+    overview_entries: list[tuple[str, dict]],
+    overview_words: dict[str, list[int]],
+) -> dict[str, str]:
+    """Try to fuzzy-match an issue filename to an Issues Overview entry.
 
-def _match_overview(filename_issue: str, overview: dict[str, dict]) -> dict[str, str]:
-    """Try to fuzzy-match an issue filename to an Issues Overview entry."""
+    overview_entries holds (key, meta) for the non-accessibility entries of
+    overview, and overview_words maps each word to the entries containing it.
+    """
     # Exact lowercase match
     key = filename_issue.lower()
     if key in overview:
         return {**overview[key], "name": filename_issue}
 
     # Try matching by checking if overview name words are in filename
-    fn_words = set(key.split())
-    best_score = 0
-    best_match: dict[str, str] = {}
-    for ov_key, ov_meta in overview.items():
-        ov_words = set(ov_key.split())
-        # Skip accessibility issues — those come from the violations CSV
-        if ov_key.startswith("accessibility:"):
-            continue
-        overlap = len(fn_words & ov_words)
-        if overlap > best_score and overlap >= 2:
-            best_score = overlap
-            best_match = {**ov_meta, "name": ov_key.title()}
-
-    return best_match if best_match else {"name": filename_issue}
+    overlaps: Counter[int] = Counter()
+    for word in set(key.split()):
+        overlaps.update(overview_words.get(word, ()))
+    # Most shared words wins (at least 2); ties go to the earliest entry
+    best = min(
+        (i for i, overlap in overlaps.items() if overlap >= 2),
+        key=lambda i: (-overlaps[i], i),
+        default=None,
+    )
+    if best is None:
+        return {"name": filename_issue}
+    ov_key, ov_meta = overview_entries[best]
+    return {**ov_meta, "name": ov_key.title()}
 
 
 # ---------------------------------------------------------------------------
@@ -248,23 +409,21 @@ def _match_overview(filename_issue: str, overview: dict[str, dict]) -> dict[str,
 # ---------------------------------------------------------------------------
 
 
-def _a11y_to_rows(a11y_df: pd.DataFrame, url: str) -> list[dict]:
-    """Convert accessibility violations for a URL into unified row dicts."""
-    page_df = a11y_df[a11y_df["URL"] == url]
-    rows = []
-    for _, row in page_df.iterrows():
-        rows.append(
+def _a11y_rows_by_url(a11y_df: pd.DataFrame) -> dict[str, list[dict]]:
+    """Convert accessibility violations into unified row dicts, grouped by URL."""
+    # Missing columns come back as NaN, which _clean_cached turns into ""
+    fields = a11y_df.reindex(columns=["URL", *_A11Y_COLUMNS.values()])
+    rows_by_url: dict[str, list[dict]] = defaultdict(list)
+    for url, *values in fields.itertuples(index=False, name=None):
+        if pd.isna(url):
+            continue
+        rows_by_url[url].append(
             {
                 "Type": "Accessibility",
-                "Issue": _clean(row.get("Issue", "")),
-                "Priority": _clean(row.get("Priority", "")),
-                "Details": _clean(row.get("Location on Page", "")),
-                "Description": _clean(row.get("Issue Description", "")),
-                "How To Fix": _clean(row.get("How To Fix", "")),
-                "Help URL": _clean(row.get("Help URL", "")),
+                **{key: _clean_cached(v) for key, v in zip(_A11Y_COLUMNS, values)},
             }
         )
-    return rows
+    return dict(rows_by_url)
 
 
 # ---------------------------------------------------------------------------
@@ -292,41 +451,67 @@ def _url_to_sheet_name(url: str, seen: dict[str, int]) -> str:
     return name
 
 
-def _style_header_row(ws, row_num: int) -> None:
-    for cell in ws[row_num]:
+# The workbook is write-only: cells are styled before they're appended, and
+# column widths / freeze panes must be set before a sheet's first row.
+
+
+def _header_cells(ws, values: list[str]) -> list[Cell]:
+    cells = []
+    for value in values:
+        cell = WriteOnlyCell(ws, value=value)
         cell.font = HEADER_FONT
         cell.fill = HEADER_FILL
         cell.alignment = WRAP_ALIGNMENT
+        cells.append(cell)
+    return cells
 
 
-def _auto_column_widths(ws, max_width: int = 60) -> None:
-    for col_idx, col_cells in enumerate(ws.columns, 1):
-        max_len = 0
-        for cell in col_cells:
-            if cell.value:
-                max_len = max(max_len, len(str(cell.value)))
+def _link_cell(ws, value: str, target: str | None = None) -> Cell:
+    cell = WriteOnlyCell(ws, value=value)
+    cell.hyperlink = target or value
+    cell.font = LINK_FONT
+    return cell
+
+
+def _clickable(ws, value: str) -> Cell | str:
+    """Wrap URL values in a hyperlink cell; pass anything else through."""
+    return _link_cell(ws, value) if value and _is_url(value) else value
+
+
+def _auto_column_widths(ws, rows: list[list], max_width: int = 60) -> None:
+    max_lens: dict[int, int] = {}
+    for row in rows:
+        for col_idx, value in enumerate(row, 1):
+            if isinstance(value, Cell):
+                value = value.value
+            length = len(str(value)) if value else 0
+            max_lens[col_idx] = max(max_lens.get(col_idx, 0), length)
+    for col_idx, max_len in max_lens.items():
         width = min(max_len + 2, max_width)
         ws.column_dimensions[get_column_letter(col_idx)].width = max(width, 12)
 
 
-def _make_urls_clickable(ws) -> None:
-    """Scan all cells and make any URL values into clickable hyperlinks."""
-    for row in ws.iter_rows(min_row=2):
-        for cell in row:
-            if cell.value and isinstance(cell.value, str) and _is_url(cell.value):
-                cell.hyperlink = cell.value
-                cell.font = LINK_FONT
+def _write_rows(ws, rows: list[list], freeze_panes: str) -> None:
+    """Size columns, then stream all rows into a write-only sheet."""
+    _auto_column_widths(ws, rows)
+    ws.freeze_panes = freeze_panes
+    for row in rows:
+        ws.append(row)
+    # Flush to disk now; otherwise every sheet holds a temp file open until save
+    ws.close()
 
 
 def _df_to_sheet(wb: Workbook, name: str, df: pd.DataFrame) -> None:
     ws = wb.create_sheet(title=name)
-    ws.append(list(df.columns))
-    for _, row in df.iterrows():
-        ws.append([str(v) if pd.notna(v) else "" for v in row])
-    _style_header_row(ws, 1)
-    _make_urls_clickable(ws)
-    _auto_column_widths(ws)
-    ws.freeze_panes = "A2"
+    rows: list[list] = [_header_cells(ws, list(df.columns))]
+    # Numeric columns can't hold URLs, so only text columns are checked
+    text_cols = [not pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes]
+    # Stringify the whole frame at once rather than per cell
+    for row in df.fillna("").astype(str).to_numpy().tolist():
+        rows.append(
+            [_clickable(ws, v) if is_text else v for v, is_text in zip(row, text_cols)]
+        )
+    _write_rows(ws, rows, "A2")
 
 
 # ---------------------------------------------------------------------------
@@ -343,8 +528,7 @@ def generate_report(export_dir: Path, output_path: Path) -> Path:
     - Pages index sheet (with hyperlinks)
     - One sheet per page with combined issues + accessibility violations
     """
-    wb = Workbook()
-    wb.remove(wb.active)
+    wb = Workbook(write_only=True)
 
     # --- Issues Summary ---
     issues_df = _load_issues_overview(export_dir)
@@ -382,41 +566,42 @@ def generate_report(export_dir: Path, output_path: Path) -> Path:
 
     # --- Load per-page issues (internal URLs only) ---
     internal_urls = _load_internal_urls(export_dir)
-    per_page_issues = _load_per_page_issues(export_dir, issues_df, internal_urls)
-    issue_url_count = len(per_page_issues)
-    print(f"  Per-page issues loaded for {issue_url_count} URLs")
 
     # --- Filter accessibility to internal HTML pages only ---
     if a11y_df is not None and internal_urls:
         a11y_df = a11y_df[a11y_df["URL"].isin(internal_urls)]
 
     # --- Build combined per-page data ---
-    # Collect all URLs that have either accessibility or issue data
-    all_urls: set[str] = set()
-    if a11y_df is not None:
-        all_urls.update(a11y_df["URL"].unique())
-    all_urls.update(per_page_issues.keys())
-
-    # Build {url: [row_dicts]} combining both sources
-    url_rows: dict[str, list[dict]] = {}
-    for url in all_urls:
-        rows: list[dict] = []
-        if a11y_df is not None:
-            rows.extend(_a11y_to_rows(a11y_df, url))
-        rows.extend(per_page_issues.get(url, []))
-        if rows:
-            url_rows[url] = rows
+    # One pass over the violations instead of a full-frame mask per URL
+    a11y_rows = _a11y_rows_by_url(a11y_df) if a11y_df is not None else {}
+
+    # Build {url: [row_dicts]} for all URLs with accessibility or issue data,
+    # folding issue rows in as they're parsed, after each page's violations
+    url_rows: dict[str, list[dict]] = defaultdict(list, a11y_rows)
+    issue_urls: set[str] = set()
+    for url, row in _load_per_page_issues(export_dir, issues_df, internal_urls):
+        url_rows[url].append(row)
+        issue_urls.add(url)
+    print(f"  Per-page issues loaded for {len(issue_urls)} URLs")
 
     # --- Deduplicate pages with identical combined data ---
-    def _fingerprint(rows: list[dict]) -> str:
-        sortable = [tuple(sorted(r.items())) for r in rows]
-        sortable.sort()
-        return repr(sortable)
-
-    url_fingerprints = {url: _fingerprint(rows) for url, rows in url_rows.items()}
-    fp_to_urls: dict[str, list[str]] = defaultdict(list)
-    for url, fp in sorted(url_fingerprints.items()):
-        fp_to_urls[fp].append(url)
+    def _fingerprint(rows: list[dict]) -> bytes:
+        # Digest each row in column order, then digest the sorted row digests
+        # so the key is a small order-independent hash, not a huge repr
+        row_digests = []
+        for r in rows:
+            h = hashlib.blake2b(digest_size=16)
+            for value in _PAGE_VALUES(r):
+                h.update(value.encode())
+                h.update(b"\0")
+            row_digests.append(h.digest())
+        row_digests.sort()
+        return hashlib.blake2b(b"".join(row_digests), digest_size=16).digest()
+
+    # Visiting URLs in sorted order keeps groups and their URL lists stable
+    fp_to_urls: dict[bytes, list[str]] = defaultdict(list)
+    for url in sorted(url_rows):
+        fp_to_urls[_fingerprint(url_rows[url])].append(url)
 
     # --- Write per-page sheets ---
     page_index: list[dict] = []
@@ -431,38 +616,30 @@ def generate_report(export_dir: Path, output_path: Path) -> Path:
 
         # URLs at top
         if len(urls) == 1:
-            ws.append(["URL", urls[0]])
-            cell = ws.cell(row=1, column=2)
-            cell.hyperlink = urls[0]
-            cell.font = LINK_FONT
+            sheet_rows: list[list] = [
+                [WriteOnlyCell(ws, value="URL"), _link_cell(ws, urls[0])]
+            ]
         else:
-            ws.append(["URLs", f"{len(urls)} pages with identical issues"])
-            for u in urls:
-                ws.append(["", u])
-                cell = ws.cell(row=ws.max_row, column=2)
-                cell.hyperlink = u
-                cell.font = LINK_FONT
-
-        ws.append([])  # separator
-        ws["A1"].font = Font(bold=True)
-
-        # Data table
-        header_row = ws.max_row + 1
-        ws.append(PAGE_COLUMNS)
+            sheet_rows = [
+                [
+                    WriteOnlyCell(ws, value="URLs"),
+                    f"{len(urls)} pages with identical issues",
+                ]
+            ]
+            sheet_rows.extend(["", _link_cell(ws, u)] for u in urls)
+        sheet_rows[0][0].font = BOLD_FONT
+        sheet_rows.append([])  # separator
+
+        # Data table, with a clickable Help URL column
+        header_row = len(sheet_rows) + 1
+        sheet_rows.append(_header_cells(ws, PAGE_COLUMNS))
+        help_col = PAGE_COLUMNS.index("Help URL")
         for r in rows:
-            ws.append([str(r.get(c, "")) for c in PAGE_COLUMNS])
-
-        # Make Help URL column clickable
-        help_col_idx = PAGE_COLUMNS.index("Help URL") + 1
-        for row_num in range(header_row + 1, ws.max_row + 1):
-            cell = ws.cell(row=row_num, column=help_col_idx)
-            if cell.value and _is_url(str(cell.value)):
-                cell.hyperlink = cell.value
-                cell.font = LINK_FONT
+            values = list(_PAGE_VALUES(r))
+            values[help_col] = _clickable(ws, values[help_col])
+            sheet_rows.append(values)
 
-        _style_header_row(ws, header_row)
-        _auto_column_widths(ws)
-        ws.freeze_panes = f"A{header_row + 1}"
+        _write_rows(ws, sheet_rows, f"A{header_row + 1}")
 
         # Count by type for the index
         a11y_count = sum(1 for r in rows if r["Type"] == "Accessibility")
@@ -482,32 +659,21 @@ def generate_report(export_dir: Path, output_path: Path) -> Path:
     # --- Pages index with hyperlinks ---
     ws = wb.create_sheet(title="Pages")
     headers = ["URL", "Sheet", "Accessibility", "Issues", "Duplicates"]
-    ws.append(headers)
+    page_rows: list[list] = [_header_cells(ws, headers)]
     for entry in page_index:
-        row_num = ws.max_row + 1
         dupes = entry["Duplicates"]
-        ws.append(
+        # Clickable URL and clickable sheet link
+        sheet_ref = entry["Sheet"].replace("'", "''")
+        page_rows.append(
             [
-                entry["URL"],
-                entry["Sheet"],
+                _link_cell(ws, entry["URL"]),
+                _link_cell(ws, entry["Sheet"], f"#'{sheet_ref}'!A1"),
                 str(entry["Accessibility"]),
                 str(entry["Issues"]),
                 str(dupes) if dupes else "",
             ]
         )
-        # Clickable URL
-        url_cell = ws.cell(row=row_num, column=1)
-        url_cell.hyperlink = entry["URL"]
-        url_cell.font = LINK_FONT
-        # Clickable sheet link
-        sheet_ref = entry["Sheet"].replace("'", "''")
-        sheet_cell = ws.cell(row=row_num, column=2)
-        sheet_cell.hyperlink = f"#'{sheet_ref}'!A1"
-        sheet_cell.font = LINK_FONT
-
-    _style_header_row(ws, 1)
-    _auto_column_widths(ws)
-    ws.freeze_panes = "A2"
+    _write_rows(ws, page_rows, "A2")
 
     # Move Pages to after summaries
     summary_count = sum(